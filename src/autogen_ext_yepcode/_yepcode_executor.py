@@ -3,30 +3,89 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import json
+import operator
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from autogen_core import CancellationToken, Component
 from autogen_core.code_executor import CodeBlock, CodeExecutor, CodeResult
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
-try:
-    from dotenv import load_dotenv
-except ImportError:
-    load_dotenv = None
+if TYPE_CHECKING:
+    from yepcode_run import Execution, YepCodeRun
 
-try:
-    from yepcode_run import YepCodeRun, YepCodeApiConfig
-except ImportError as e:
-    raise RuntimeError(
-        "Missing dependencies for YepCodeCodeExecutor. Please install with: pip install yepcode-run"
-    ) from e
+# dotenv and yepcode_run are imported on first use to keep this module cheap to import.
 
+T = TypeVar("T")
 
-@dataclass
+# Whether the .env file has already been loaded by an executor in this process.
+_DOTENV_LOADED = False
+
+# The YEPCODE_API_TOKEN environment variable, once it has been found.
+_CACHED_ENV_TOKEN: Optional[str] = None
+
+
+def _env_token() -> Optional[str]:
+    """Return the YEPCODE_API_TOKEN environment variable, memoized once set."""
+    global _CACHED_ENV_TOKEN
+    if _CACHED_ENV_TOKEN is None:
+        _CACHED_ENV_TOKEN = os.environ.get("YEPCODE_API_TOKEN") or None
+    return _CACHED_ENV_TOKEN
+
+
+# Backoff bounds, in seconds, used while polling for an execution to finish.
+_POLL_INITIAL_DELAY = 0.2
+_POLL_MAX_DELAY = 2.0
+
+# Values of yepcode_run.ExecutionStatus for executions that have not finished.
+_PENDING_STATUSES = frozenset({"CREATED", "RUNNING"})
+
+# Language names and aliases mapped to the YepCode language names.
+_LANG_MAP: Dict[str, str] = {
+    "js": "javascript",
+    "javascript": "javascript",
+    "py": "python",
+    "python": "python",
+}
+
+# Fields of a YepCode log entry, in the order they are formatted.
+_LOG_FIELDS = operator.attrgetter("timestamp", "level", "message")
+
+# Code run by the warm-up execution.
+_WARMUP_CODE = 'print("warm")'
+
+# Template for a fused Python block, printing its marker before its code.
+_FUSED_BLOCK_TEMPLATE = "print({marker}, flush=True)\n{code}"
+
+# Python blocks that cannot be fused: a ``main`` entry point would be replaced by
+# the one of a later block, and ``__future__`` imports must start the program.
+_UNFUSABLE_PYTHON = re.compile(
+    r"^\s*(?:(?:async\s+)?def\s+main\s*\(|from\s+__future__\s+import\b)",
+    re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class YepCodeCodeResult(CodeResult):
     """A code result class for YepCode executor."""
 
@@ -34,6 +93,10 @@ class YepCodeCodeResult(CodeResult):
     """The YepCode execution ID for this result."""
 
 
+# Shared result for calls without code blocks; it must not be modified.
+_EMPTY_RESULT = YepCodeCodeResult(exit_code=0, output="")
+
+
 class YepCodeCodeExecutorConfig(BaseModel):
     """Configuration for YepCodeCodeExecutor"""
 
@@ -47,6 +110,28 @@ class YepCodeCodeExecutorConfig(BaseModel):
     sync_execution: bool = Field(
         default=True, description="Wait for execution to complete"
     )
+    max_concurrency: int = Field(
+        default=1, description="Maximum number of code blocks executed concurrently"
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Maximum number of threads used for YepCode SDK calls. Defaults to min(32, CPU count + 4)",
+    )
+    enable_memoization: bool = Field(
+        default=False,
+        description="Reuse results of previously successful executions of the same code",
+    )
+    memo_max_entries: int = Field(
+        default=128, description="Maximum number of memoized execution results"
+    )
+    fuse_blocks: bool = Field(
+        default=False,
+        description="Run consecutive Python code blocks without a main entry point in a single execution",
+    )
+    warmup: bool = Field(
+        default=False,
+        description="Run a trivial execution in the background on start to warm up a sandbox",
+    )
 
 
 class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
@@ -55,8 +140,10 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
     This executor runs code in YepCode's secure, production-grade sandboxes.
     It supports Python and JavaScript execution with access any external library with automatic discovery and installation.
 
-    The executor executes code blocks serially in the order they are received.
-    Each code block is executed in a separate YepCode execution environment.
+    By default, the executor executes code blocks serially in the order they are received.
+    Each code block is executed in a separate YepCode execution environment, so when
+    ``max_concurrency`` is greater than 1 the blocks are assumed to be independent and
+    are submitted concurrently. Results are still reported in the original block order.
     Currently supports Python and JavaScript languages.
 
     Args:
@@ -64,6 +151,21 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
         timeout (int): The timeout for code execution in seconds. Default is 60.
         remove_on_done (bool): Whether to remove the execution after completion. Default is False.
         sync_execution (bool): Whether to wait for execution to complete. Default is True.
+        max_concurrency (int): The maximum number of code blocks executed concurrently. Default is 1.
+        max_workers (Optional[int]): The maximum number of threads used for blocking YepCode SDK calls.
+            Each thread only waits on a single HTTP request at a time. If None, uses the
+            ``ThreadPoolExecutor`` default for I/O bound work, ``min(32, os.cpu_count() + 4)``.
+        enable_memoization (bool): Whether to reuse the result of a previous successful execution
+            of the same code instead of running it again. Only enable it for deterministic,
+            side-effect free code. Default is False.
+        memo_max_entries (int): The maximum number of memoized results kept. Default is 128.
+        fuse_blocks (bool): Whether to run consecutive Python code blocks in a single YepCode
+            execution when ``sync_execution`` is True. Blocks defining a ``main`` entry point or
+            using ``from __future__`` imports, and JavaScript blocks, are always executed on their
+            own. Fused blocks share one global namespace and one execution ID, and the execution's
+            return value is reported for the last block of each group. Default is False.
+        warmup (bool): Whether to run a trivial execution in the background on start, so the first
+            code blocks do not pay the sandbox cold start. Default is False.
 
     Example:
 
@@ -96,6 +198,8 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
     component_provider_override = "autogen_ext_yepcode.YepCodeCodeExecutor"
 
     SUPPORTED_LANGUAGES: ClassVar[List[str]] = ["python", "javascript"]
+    _SUPPORTED_SET: ClassVar[frozenset[str]] = frozenset(SUPPORTED_LANGUAGES)
+    _SUPPORTED_LANGS_STR: ClassVar[str] = ", ".join(SUPPORTED_LANGUAGES)
 
     def __init__(
         self,
@@ -103,16 +207,35 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
         timeout: int = 60,
         remove_on_done: bool = False,
         sync_execution: bool = True,
+        max_concurrency: int = 1,
+        max_workers: Optional[int] = None,
+        enable_memoization: bool = False,
+        memo_max_entries: int = 128,
+        fuse_blocks: bool = False,
+        warmup: bool = False,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be greater than or equal to 1.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("Max workers must be greater than or equal to 1.")
+        if memo_max_entries < 1:
+            raise ValueError("Memo max entries must be greater than or equal to 1.")
 
         # Load environment variables from .env file if dotenv is available
-        if load_dotenv is not None:
-            load_dotenv()
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            _DOTENV_LOADED = True
+            try:
+                from dotenv import load_dotenv
+            except ImportError:
+                pass
+            else:
+                load_dotenv()
 
         # Get API token from parameter or environment
-        self._api_token = api_token or os.getenv("YEPCODE_API_TOKEN")
+        self._api_token = api_token or _env_token()
         if not self._api_token:
             raise ValueError(
                 "YepCode API token is required. Provide it via api_token parameter or YEPCODE_API_TOKEN environment variable."
@@ -121,23 +244,128 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
         self._timeout = timeout
         self._remove_on_done = remove_on_done
         self._sync_execution = sync_execution
+        # Execution options shared by every block; only the language varies.
+        self._base_opts: Dict[str, Any] = {
+            "removeOnDone": self._remove_on_done,
+            "timeout": self._timeout * 1000,  # Convert to milliseconds
+        }
+        self._max_concurrency = max_concurrency
+        self._max_workers = max_workers
+        self._enable_memoization = enable_memoization
+        self._memo_max_entries = memo_max_entries
+        self._memo: OrderedDict[bytes, YepCodeCodeResult] = OrderedDict()
+        # Number of in-flight executions of each code when processes are removed.
+        self._in_flight: Dict[str, int] = {}
+        self._fuse_blocks = fuse_blocks
+        self._warmup = warmup
+        self._warmup_task: Optional[asyncio.Task[None]] = None
         self._started = False
         self._runner: Optional[YepCodeRun] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     @property
     def timeout(self) -> int:
         """The timeout for code execution."""
         return self._timeout
 
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking YepCode SDK call in the executor's thread pool."""
+        pool = self._pool
+        if pool is None:
+            # Never fall back to the default executor once the executor is stopped.
+            raise RuntimeError("Executor must be started before running YepCode calls.")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, functools.partial(func, *args))
+
+    async def _start_execution(self, code: str, lang: str) -> Tuple[str, str]:
+        """Create the YepCode process for the code and start executing it.
+
+        Returns the process ID and the execution ID.
+        """
+        runner = self._runner
+        if self._remove_on_done:
+            # Identical code shares one process, so it is only removed once the
+            # last execution using it has finished.
+            self._in_flight[code] = self._in_flight.get(code, 0) + 1
+        try:
+            process_id = await self._run_blocking(runner.create_process, code, lang)
+            response = await self._run_blocking(
+                runner.yepcode_api.execute_process_async,
+                process_id,
+                {},
+                self._base_opts | {"language": lang},
+            )
+        except BaseException:
+            if self._remove_on_done:
+                self._release_process(code)
+            raise
+        return process_id, response["executionId"]
+
+    async def _await_execution(
+        self, code: str, process_id: str, execution_id: str
+    ) -> Execution:
+        """Wait for an execution to finish and return it.
+
+        ``YepCodeRun.run`` polls inside the ``Execution`` constructor until the
+        execution finishes, holding a thread the whole time. Instead, the status
+        is polled from the event loop with exponential backoff, and the
+        ``Execution`` is only loaded once it has finished.
+        """
+        runner = self._runner
+        remove_process = False
+        try:
+            delay = _POLL_INITIAL_DELAY
+            execution_data = await self._run_blocking(
+                runner.yepcode_api.get_execution, execution_id
+            )
+            while execution_data.get("status") in _PENDING_STATUSES:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _POLL_MAX_DELAY)
+                execution_data = await self._run_blocking(
+                    runner.yepcode_api.get_execution, execution_id
+                )
+
+            execution = await self._run_blocking(runner.get_execution, execution_id)
+        finally:
+            if self._remove_on_done:
+                remove_process = self._release_process(code)
+
+        if remove_process:
+            await self._run_blocking(runner.yepcode_api.delete_process, process_id)
+        return execution
+
+    def _release_process(self, code: str) -> bool:
+        """Release an in-flight execution of the code.
+
+        Returns whether it was the last one, so its process can be removed.
+        """
+        remaining = self._in_flight[code] - 1
+        if remaining:
+            self._in_flight[code] = remaining
+            return False
+        del self._in_flight[code]
+        return True
+
+    async def _run_warmup(self) -> None:
+        """Run a trivial execution to warm up a YepCode sandbox, ignoring its result.
+
+        It runs on the default executor rather than the executor's thread pool, so
+        code blocks executed meanwhile never wait for a thread behind it.
+        """
+        runner = self._runner
+        try:
+            await asyncio.to_thread(
+                runner.run,
+                _WARMUP_CODE,
+                self._base_opts | {"language": "python", "removeOnDone": True},
+            )
+        except Exception:
+            pass
+
     def _normalize_language(self, language: str) -> str:
         """Normalize language name to YepCode format."""
         lang = language.lower()
-        if lang in ["js", "javascript"]:
-            return "javascript"
-        elif lang in ["python", "py"]:
-            return "python"
-        else:
-            return lang
+        return _LANG_MAP.get(lang, lang)
 
     async def execute_code_blocks(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
@@ -149,80 +377,272 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
             cancellation_token (CancellationToken): Token to cancel the operation.
 
         Returns:
-            YepCodeCodeResult: The result of the code execution.
+            YepCodeCodeResult: The result of the code execution. Results may be shared
+            between calls (e.g. when no code blocks are given or results are memoized),
+            so they must be treated as immutable.
         """
         if not self._started:
             raise RuntimeError("Executor must be started before executing code blocks.")
 
         if not code_blocks:
-            return YepCodeCodeResult(exit_code=0, output="")
+            return _EMPTY_RESULT
 
-        outputs: List[str] = []
-        last_execution_id: Optional[str] = None
-
-        for code_block in code_blocks:
-            lang = self._normalize_language(code_block.language)
-
-            if lang not in ["python", "javascript"]:
+        # Validate every block before any of them is sent to YepCode
+        langs = [self._normalize_language(b.language) for b in code_blocks]
+        for code_block, lang in zip(code_blocks, langs):
+            if lang not in self._SUPPORTED_SET:
                 return YepCodeCodeResult(
                     exit_code=1,
-                    output=f"Unsupported language: {code_block.language}. Supported languages: {', '.join(self.SUPPORTED_LANGUAGES)}",
+                    output=f"Unsupported language: {code_block.language}. Supported languages: {self._SUPPORTED_LANGS_STR}",
                 )
 
-            try:
-                # Execute code using YepCode
-                execution = await asyncio.to_thread(
-                    self._runner.run,
-                    code_block.code,
-                    {
-                        "language": lang,
-                        "removeOnDone": self._remove_on_done,
-                        "timeout": self._timeout * 1000,  # Convert to milliseconds
-                    },
+        if self._fuse_blocks and self._sync_execution:
+            batches = self._group_code_blocks(code_blocks, langs)
+        else:
+            batches = [(lang, [b]) for lang, b in zip(langs, code_blocks)]
+
+        if self._max_concurrency > 1:
+            # Every batch runs in its own YepCode execution, so batches are assumed
+            # to be independent of each other and can be submitted concurrently.
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            async def _run_one(
+                batch: Tuple[str, List[CodeBlock]],
+            ) -> List[YepCodeCodeResult]:
+                async with semaphore:
+                    return await self._execute_batch(*batch)
+
+            batch_results = await asyncio.gather(*[_run_one(b) for b in batches])
+            return self._combine_results(
+                [result for results in batch_results for result in results]
+            )
+
+        results: List[YepCodeCodeResult] = []
+        for lang, batch in batches:
+            results.extend(await self._execute_batch(lang, batch))
+            if results[-1].exit_code != 0:
+                break
+
+        return self._combine_results(results)
+
+    def _group_code_blocks(
+        self, code_blocks: List[CodeBlock], langs: List[str]
+    ) -> List[Tuple[str, List[CodeBlock]]]:
+        """Group consecutive Python code blocks that can be fused into one execution."""
+        batches: List[Tuple[str, List[CodeBlock]]] = []
+        last_fusable = False
+        for code_block, lang in zip(code_blocks, langs):
+            fusable = lang == "python" and not _UNFUSABLE_PYTHON.search(code_block.code)
+            if fusable and last_fusable:
+                batches[-1][1].append(code_block)
+            else:
+                batches.append((lang, [code_block]))
+            last_fusable = fusable
+        return batches
+
+    async def _execute_batch(
+        self, lang: str, code_blocks: List[CodeBlock]
+    ) -> List[YepCodeCodeResult]:
+        """Execute a batch of code blocks, fusing them when there is more than one.
+
+        The returned results are in block order and end at the first failed block.
+        """
+        if len(code_blocks) == 1:
+            return [await self._execute_code_block(code_blocks[0], lang)]
+        return await self._execute_fused_code_blocks(code_blocks, lang)
+
+    async def _execute_code_block(
+        self, code_block: CodeBlock, lang: str
+    ) -> YepCodeCodeResult:
+        """Execute a single code block in the given normalized language."""
+        memo_key: Optional[bytes] = None
+        if self._enable_memoization and self._sync_execution:
+            memo_key = hashlib.sha256(f"{lang}\0{code_block.code}".encode()).digest()
+            memoized = self._memo.get(memo_key)
+            if memoized is not None:
+                self._memo.move_to_end(memo_key)
+                return memoized
+
+        execution_id: Optional[str] = None
+        try:
+            # Execute code using YepCode
+            process_id, execution_id = await self._start_execution(
+                code_block.code, lang
+            )
+
+            # The process can only be removed once the execution has finished
+            if self._sync_execution or self._remove_on_done:
+                execution = await self._await_execution(
+                    code_block.code, process_id, execution_id
+                )
+
+            if not self._sync_execution:
+                return YepCodeCodeResult(
+                    exit_code=0,
+                    output=f"Execution started with ID: {execution_id}",
+                    execution_id=execution_id,
                 )
 
-                last_execution_id = execution.id
+            logs_output = self._format_logs(execution.logs)
 
-                if self._sync_execution:
-                    # Wait for execution to complete
-                    await asyncio.to_thread(execution.wait_for_done)
+            # Check if execution was successful
+            if execution.error:
+                output = f"Execution failed with error:\n{execution.error}{logs_output}"
 
-                    logs_output = ""
-                    # Get logs
-                    if execution.logs:
-                        logs_output = "\n\nExecution logs:\n" + "\n".join(
-                            [
-                                f"{log.timestamp} - {log.level}: {log.message}"
-                                for log in execution.logs
-                            ]
-                        )
+                return YepCodeCodeResult(
+                    exit_code=1, output=output, execution_id=execution.id
+                )
 
-                    # Check if execution was successful
-                    if execution.error:
-                        output = f"Execution failed with error:\n{execution.error}{logs_output}"
+            result = YepCodeCodeResult(
+                exit_code=0,
+                output=self._format_output(execution.return_value, logs_output),
+                execution_id=execution.id,
+            )
+            if memo_key is not None:
+                self._memoize(memo_key, result)
+            return result
 
-                        return YepCodeCodeResult(
-                            exit_code=1, output=output, execution_id=execution.id
-                        )
+        except Exception as e:
+            return YepCodeCodeResult(
+                exit_code=1,
+                output=f"Error executing code: {str(e)}",
+                execution_id=execution_id,
+            )
 
-                    # Get output
-                    output = ""
-                    if execution.return_value:
-                        output = f"Execution result:\n{execution.return_value}"
+    async def _execute_fused_code_blocks(
+        self, code_blocks: List[CodeBlock], lang: str
+    ) -> List[YepCodeCodeResult]:
+        """Execute Python code blocks as a single YepCode execution.
 
-                    output += logs_output
+        Each block is preceded by a statement printing a unique marker, which is used
+        to split the execution logs back into per-block outputs. The markers are
+        derived from the blocks' code, so fusing the same blocks again reuses the
+        same YepCode process.
+        """
+        token = hashlib.sha256(
+            "\0".join(code_block.code for code_block in code_blocks).encode()
+        ).hexdigest()
+        markers = [f"--- block {i} {token} ---" for i in range(len(code_blocks))]
+        code = "\n".join(
+            _FUSED_BLOCK_TEMPLATE.format(marker=json.dumps(marker), code=code_block.code)
+            for marker, code_block in zip(markers, code_blocks)
+        )
 
-                    outputs.append(output)
+        execution_id: Optional[str] = None
+        try:
+            process_id, execution_id = await self._start_execution(code, lang)
+            execution = await self._await_execution(code, process_id, execution_id)
+
+            # Split logs by the markers; the last marker seen is the running block.
+            marker_indexes = {marker: i for i, marker in enumerate(markers)}
+            block_logs: List[List[Any]] = [[] for _ in code_blocks]
+            seen: List[int] = []
+            for log in execution.logs:
+                index = marker_indexes.get(str(log.message).strip())
+                if index is not None:
+                    seen.append(index)
                 else:
-                    outputs.append(f"Execution started with ID: {execution.id}")
+                    block_logs[seen[-1] if seen else 0].append(log)
+
+            # Every block up to the failing one, or every block on success, must
+            # have printed its marker. Otherwise the program failed before any block
+            # ran (e.g. a syntax error), exited early, or its logs could not be
+            # split, so execute the blocks one by one instead.
+            if not seen or seen != list(range(len(seen))) or (
+                not execution.error and len(seen) != len(code_blocks)
+            ):
+                results: List[YepCodeCodeResult] = []
+                for code_block in code_blocks:
+                    results.append(await self._execute_code_block(code_block, lang))
+                    if results[-1].exit_code != 0:
+                        break
+                return results
+
+            last = seen[-1]
+            results = [
+                YepCodeCodeResult(
+                    exit_code=0,
+                    output=self._format_output(None, self._format_logs(logs)),
+                    execution_id=execution.id,
+                )
+                for logs in block_logs[:last]
+            ]
+            logs_output = self._format_logs(block_logs[last])
+
+            if execution.error:
+                output = f"Execution failed with error:\n{execution.error}{logs_output}"
+                results.append(
+                    YepCodeCodeResult(
+                        exit_code=1, output=output, execution_id=execution.id
+                    )
+                )
+            else:
+                results.append(
+                    YepCodeCodeResult(
+                        exit_code=0,
+                        output=self._format_output(execution.return_value, logs_output),
+                        execution_id=execution.id,
+                    )
+                )
+            return results
 
-            except Exception as e:
-                return YepCodeCodeResult(
+        except Exception as e:
+            return [
+                YepCodeCodeResult(
                     exit_code=1,
                     output=f"Error executing code: {str(e)}",
+                    execution_id=execution_id,
+                )
+            ]
+
+    def _format_logs(self, logs: List[Any]) -> str:
+        """Format execution logs to be appended to a block output."""
+        if not logs:
+            return ""
+        return "\n\nExecution logs:\n" + "\n".join(
+            map("%s - %s: %s".__mod__, map(_LOG_FIELDS, logs))
+        )
+
+    def _format_output(self, return_value: Any, logs_output: str) -> str:
+        """Format the output of a successful block."""
+        parts: List[str] = []
+        if return_value:
+            parts.extend(["Execution result:\n", str(return_value)])
+        parts.append(logs_output)
+
+        return "".join(parts)
+
+    def _memoize(self, key: bytes, result: YepCodeCodeResult) -> None:
+        """Store a successful result, evicting the least recently used one if full."""
+        self._memo[key] = result
+        self._memo.move_to_end(key)
+        if len(self._memo) > self._memo_max_entries:
+            self._memo.popitem(last=False)
+
+    def _combine_results(
+        self, results: List[YepCodeCodeResult]
+    ) -> YepCodeCodeResult:
+        """Combine per-block results, in block order, into a single result.
+
+        The first failed block determines the result, as if blocks had been
+        executed serially.
+        """
+        outputs: List[str] = []
+        last_execution_id: Optional[str] = None
+
+        for result in results:
+            if result.execution_id is not None:
+                last_execution_id = result.execution_id
+
+            if result.exit_code != 0:
+                return YepCodeCodeResult(
+                    exit_code=result.exit_code,
+                    output=result.output,
                     execution_id=last_execution_id,
                 )
 
+            outputs.append(result.output)
+
         return YepCodeCodeResult(
             exit_code=0, output="\n===\n".join(outputs), execution_id=last_execution_id
         )
@@ -239,26 +659,49 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
     async def start(self) -> None:
         """Start the code executor.
 
-        Initializes the YepCode runner with the provided API token.
+        Initializes the YepCode runner with the provided API token and the
+        thread pool used for blocking SDK calls. If ``warmup`` is enabled, a
+        trivial execution is started in the background.
         """
         if self._started:
             return
 
+        try:
+            from yepcode_run import YepCodeApiConfig, YepCodeRun
+        except ImportError as e:
+            raise RuntimeError(
+                "Missing dependencies for YepCodeCodeExecutor. Please install with: pip install yepcode-run"
+            ) from e
+
         try:
             config = YepCodeApiConfig(api_token=self._api_token)
             self._runner = YepCodeRun(config)
-            self._started = True
         except Exception as e:
             raise RuntimeError(f"Failed to initialize YepCode runner: {str(e)}") from e
 
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="yepcode",
+        )
+        self._started = True
+
+        if self._warmup:
+            self._warmup_task = asyncio.create_task(self._run_warmup())
+
     async def stop(self) -> None:
         """Stop the code executor.
 
-        Cleans up the YepCode runner.
+        Cleans up the YepCode runner and shuts down the thread pool.
         """
         if not self._started:
             return
 
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         self._runner = None
         self._started = False
 
@@ -278,11 +721,18 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
 
     def _to_config(self) -> YepCodeCodeExecutorConfig:
         """Convert the component to a config object."""
-        return YepCodeCodeExecutorConfig(
+        # Values were already validated by __init__, so skip pydantic validation
+        return YepCodeCodeExecutorConfig.model_construct(
             api_token=self._api_token,
             timeout=self._timeout,
             remove_on_done=self._remove_on_done,
             sync_execution=self._sync_execution,
+            max_concurrency=self._max_concurrency,
+            max_workers=self._max_workers,
+            enable_memoization=self._enable_memoization,
+            memo_max_entries=self._memo_max_entries,
+            fuse_blocks=self._fuse_blocks,
+            warmup=self._warmup,
         )
 
     @classmethod
@@ -293,4 +743,10 @@ class YepCodeCodeExecutor(CodeExecutor, Component[YepCodeCodeExecutorConfig]):
             timeout=config.timeout,
             remove_on_done=config.remove_on_done,
             sync_execution=config.sync_execution,
+            max_concurrency=config.max_concurrency,
+            max_workers=config.max_workers,
+            enable_memoization=config.enable_memoization,
+            memo_max_entries=config.memo_max_entries,
+            fuse_blocks=config.fuse_blocks,
+            warmup=config.warmup,
         )
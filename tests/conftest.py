@@ -1,11 +1,19 @@
 """Test configuration and fixtures for YepCode executor tests."""
 
+import itertools
 import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock
 from autogen_ext_yepcode import YepCodeCodeExecutor
 
 
+@pytest.fixture(autouse=True)
+def clear_env_token_cache(monkeypatch):
+    """Fixture that clears the memoized environment API token between tests."""
+    monkeypatch.setattr("autogen_ext_yepcode._yepcode_executor._CACHED_ENV_TOKEN", None)
+
+
 @pytest.fixture
 def mock_api_token():
     """Fixture providing a mock API token."""
@@ -26,6 +34,44 @@ def mock_yepcode_run():
     return mock_run
 
 
+@pytest.fixture
+def mock_runner():
+    """Fixture providing a factory for mock YepCodeRun instances.
+
+    The factory takes a ``run(code, options)`` callable returning the finished
+    execution for each code submitted through the YepCode API.
+    """
+
+    def factory(run):
+        runner = MagicMock()
+        submissions = {}
+        execution_ids = itertools.count()
+
+        def execute_process_async(process_id, parameters, options):
+            execution_id = f"execution-{next(execution_ids)}"
+            submissions[execution_id] = (process_id, options)
+            return {"executionId": execution_id}
+
+        # The process ID is the submitted code, to keep it at hand
+        runner.create_process.side_effect = lambda code, language: code
+        runner.yepcode_api.execute_process_async.side_effect = execute_process_async
+        runner.yepcode_api.get_execution.return_value = {"status": "FINISHED"}
+        runner.get_execution.side_effect = lambda execution_id: run(
+            *submissions[execution_id]
+        )
+        return runner
+
+    return factory
+
+
+@pytest.fixture
+def thread_pool():
+    """Fixture providing a thread pool for executors marked as started by tests."""
+    pool = ThreadPoolExecutor()
+    yield pool
+    pool.shutdown()
+
+
 @pytest.fixture
 def mock_env_token(monkeypatch, mock_api_token):
     """Fixture that sets the API token in environment variables."""
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
@@ -25,11 +26,28 @@ class TestYepCodeCodeExecutor:
         executor = YepCodeCodeExecutor()
         assert executor._api_token == mock_env_token
 
+    def test_init_memoizes_env_token(self, monkeypatch, mock_env_token):
+        """Test the environment token is only resolved once."""
+        YepCodeCodeExecutor()
+        monkeypatch.delenv("YEPCODE_API_TOKEN")
+
+        executor = YepCodeCodeExecutor()
+        assert executor._api_token == mock_env_token
+
     def test_init_without_token(self):
         """Test executor initialization without API token raises error."""
         with pytest.raises(ValueError, match="YepCode API token is required"):
             YepCodeCodeExecutor()
 
+    @patch("autogen_ext_yepcode._yepcode_executor._DOTENV_LOADED", False)
+    @patch("dotenv.load_dotenv")
+    def test_init_loads_dotenv_once(self, mock_load_dotenv, mock_api_token):
+        """Test the .env file is only loaded by the first executor."""
+        YepCodeCodeExecutor(api_token=mock_api_token)
+        YepCodeCodeExecutor(api_token=mock_api_token)
+
+        mock_load_dotenv.assert_called_once()
+
     def test_init_with_custom_config(self, mock_api_token):
         """Test executor initialization with custom configuration."""
         executor = YepCodeCodeExecutor(
@@ -62,8 +80,8 @@ class TestYepCodeCodeExecutor:
         assert executor_with_token._normalize_language("PHP") == "php"
 
     @pytest.mark.asyncio
-    @patch("autogen_ext_yepcode._yepcode_executor.YepCodeRun")
-    @patch("autogen_ext_yepcode._yepcode_executor.YepCodeApiConfig")
+    @patch("yepcode_run.YepCodeRun")
+    @patch("yepcode_run.YepCodeApiConfig")
     async def test_start_success(
         self, mock_config, mock_run_class, executor_with_token
     ):
@@ -76,12 +94,16 @@ class TestYepCodeCodeExecutor:
 
         assert executor_with_token._started is True
         assert executor_with_token._runner is mock_run_instance
+        assert executor_with_token._pool is not None
+        assert executor_with_token._pool._max_workers > 1
         mock_config.assert_called_once()
         mock_run_class.assert_called_once()
 
+        await executor_with_token.stop()
+
     @pytest.mark.asyncio
-    @patch("autogen_ext_yepcode._yepcode_executor.YepCodeRun")
-    @patch("autogen_ext_yepcode._yepcode_executor.YepCodeApiConfig")
+    @patch("yepcode_run.YepCodeRun")
+    @patch("yepcode_run.YepCodeApiConfig")
     async def test_start_failure(
         self, mock_config, mock_run_class, executor_with_token
     ):
@@ -91,6 +113,96 @@ class TestYepCodeCodeExecutor:
         with pytest.raises(RuntimeError, match="Failed to initialize YepCode runner"):
             await executor_with_token.start()
 
+    @pytest.mark.asyncio
+    @patch("yepcode_run.YepCodeRun")
+    @patch("yepcode_run.YepCodeApiConfig")
+    async def test_start_warmup(self, mock_config, mock_run_class, mock_api_token):
+        """Test executor startup runs a warm-up execution in the background."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, warmup=True)
+
+        await executor.start()
+        await executor._warmup_task
+
+        mock_run_class.return_value.run.assert_called_once_with(
+            'print("warm")',
+            {"removeOnDone": True, "timeout": 60000, "language": "python"},
+        )
+
+        await executor.stop()
+        assert executor._warmup_task is None
+
+    @pytest.mark.asyncio
+    @patch("yepcode_run.YepCodeRun")
+    @patch("yepcode_run.YepCodeApiConfig")
+    async def test_warmup_does_not_delay_code_blocks(
+        self, mock_config, mock_run_class, mock_api_token, mock_runner
+    ):
+        """Test code blocks run while the warm-up execution is still in progress."""
+        warmup_started = threading.Event()
+        warmup_release = threading.Event()
+
+        def warmup_run(code, options):
+            warmup_started.set()
+            warmup_release.wait(timeout=5)
+
+        mock_execution = MagicMock(error=None, logs=[])
+        mock_execution.return_value = "result"
+        runner = mock_runner(lambda code, options: mock_execution)
+        runner.run.side_effect = warmup_run
+        mock_run_class.return_value = runner
+
+        executor = YepCodeCodeExecutor(
+            api_token=mock_api_token, max_workers=1, warmup=True
+        )
+        await executor.start()
+        await asyncio.to_thread(warmup_started.wait, 5)
+
+        code_blocks = [CodeBlock(code="print('test')", language="python")]
+
+        try:
+            result = await asyncio.wait_for(
+                executor.execute_code_blocks(code_blocks, CancellationToken()), 2
+            )
+            assert result.output == "Execution result:\nresult"
+            assert not executor._warmup_task.done()
+        finally:
+            warmup_release.set()
+            await executor._warmup_task
+            await executor.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_warmup(self, executor_with_token):
+        """Test executor stop cancels a pending warm-up execution."""
+        executor_with_token._started = True
+        executor_with_token._warmup_task = mock_task = MagicMock()
+
+        await executor_with_token.stop()
+
+        mock_task.cancel.assert_called_once()
+        assert executor_with_token._warmup_task is None
+
+    @pytest.mark.asyncio
+    @patch("yepcode_run.YepCodeRun")
+    @patch("yepcode_run.YepCodeApiConfig")
+    async def test_stop_fails_in_flight_calls(
+        self, mock_config, mock_run_class, executor_with_token
+    ):
+        """Test SDK calls made after stop fail instead of using another executor."""
+        await executor_with_token.start()
+        await executor_with_token.stop()
+
+        blocking_call = MagicMock()
+        with pytest.raises(RuntimeError, match="Executor must be started"):
+            await executor_with_token._run_blocking(blocking_call)
+        blocking_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch.dict("sys.modules", {"yepcode_run": None})
+    async def test_start_missing_dependency(self, executor_with_token):
+        """Test executor startup without yepcode-run installed raises error."""
+        with pytest.raises(RuntimeError, match="pip install yepcode-run"):
+            await executor_with_token.start()
+
     @pytest.mark.asyncio
     async def test_start_already_started(self, executor_with_token):
         """Test starting already started executor."""
@@ -108,6 +220,17 @@ class TestYepCodeCodeExecutor:
         assert executor_with_token._started is False
         assert executor_with_token._runner is None
 
+    @pytest.mark.asyncio
+    async def test_stop_shuts_down_pool(self, executor_with_token):
+        """Test executor stop shuts down the thread pool."""
+        executor_with_token._started = True
+        executor_with_token._pool = mock_pool = MagicMock()
+
+        await executor_with_token.stop()
+
+        mock_pool.shutdown.assert_called_once()
+        assert executor_with_token._pool is None
+
     @pytest.mark.asyncio
     async def test_stop_not_started(self, executor_with_token):
         """Test stopping non-started executor."""
@@ -145,6 +268,10 @@ class TestYepCodeCodeExecutor:
         assert isinstance(result, YepCodeCodeResult)
         assert result.exit_code == 0
         assert result.output == ""
+        assert (
+            await executor_with_token.execute_code_blocks([], CancellationToken())
+            is result
+        )
 
     @pytest.mark.asyncio
     async def test_execute_code_blocks_unsupported_language(self, executor_with_token):
@@ -157,17 +284,38 @@ class TestYepCodeCodeExecutor:
         )
 
         assert result.exit_code == 1
-        assert "Unsupported language" in result.output
+        assert result.output == (
+            "Unsupported language: bash. Supported languages: python, javascript"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_unsupported_language_before_execution(
+        self, executor_with_token, mock_runner
+    ):
+        """Test unsupported languages are rejected before any block is executed."""
+        executor_with_token._started = True
+        executor_with_token._runner = mock_runner(MagicMock())
+        code_blocks = [
+            CodeBlock(code="print('test')", language="python"),
+            CodeBlock(code="echo 'test'", language="bash"),
+        ]
+
+        result = await executor_with_token.execute_code_blocks(
+            code_blocks, CancellationToken()
+        )
+
+        assert result.exit_code == 1
+        assert "Unsupported language: bash" in result.output
+        executor_with_token._runner.create_process.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("autogen_ext_yepcode._yepcode_executor.asyncio.to_thread")
     async def test_execute_code_blocks_success(
-        self, mock_to_thread, executor_with_token
+        self, executor_with_token, mock_runner, thread_pool
     ):
         """Test successful code block execution."""
         # Setup
         executor_with_token._started = True
-        executor_with_token._runner = MagicMock()
+        executor_with_token._pool = thread_pool
 
         # Mock execution result
         mock_execution = MagicMock()
@@ -176,11 +324,7 @@ class TestYepCodeCodeExecutor:
         mock_execution.return_value = {"data": "test output"}
         mock_execution.logs = []
 
-        # Mock to_thread calls
-        mock_to_thread.side_effect = [
-            mock_execution,
-            None,
-        ]  # run call, wait_for_done call
+        executor_with_token._runner = mock_runner(lambda code, options: mock_execution)
 
         code_blocks = [CodeBlock(code="print('test')", language="python")]
 
@@ -191,23 +335,96 @@ class TestYepCodeCodeExecutor:
         assert result.exit_code == 0
         assert result.output == "Execution result:\n{'data': 'test output'}"
         assert result.execution_id == "test-id"
+        executor_with_token._runner.create_process.assert_called_once_with(
+            "print('test')", "python"
+        )
+        executor_with_token._runner.yepcode_api.execute_process_async.assert_called_once_with(
+            "print('test')",
+            {},
+            {"removeOnDone": False, "timeout": 60000, "language": "python"},
+        )
+        executor_with_token._runner.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_with_logs(
+        self, executor_with_token, mock_runner, thread_pool
+    ):
+        """Test execution logs are appended to the block output."""
+        executor_with_token._started = True
+        executor_with_token._pool = thread_pool
+
+        mock_execution = MagicMock()
+        mock_execution.id = "test-id"
+        mock_execution.error = None
+        mock_execution.return_value = None
+        mock_execution.logs = [
+            MagicMock(timestamp="2025-01-01T00:00:00", level="INFO", message="first"),
+            MagicMock(timestamp="2025-01-01T00:00:01", level="ERROR", message="second"),
+        ]
+        executor_with_token._runner = mock_runner(lambda code, options: mock_execution)
+
+        code_blocks = [CodeBlock(code="print('test')", language="python")]
+
+        result = await executor_with_token.execute_code_blocks(
+            code_blocks, CancellationToken()
+        )
+
+        assert result.output == (
+            "\n\nExecution logs:\n"
+            "2025-01-01T00:00:00 - INFO: first\n"
+            "2025-01-01T00:00:01 - ERROR: second"
+        )
+
+    @pytest.mark.asyncio
+    @patch("autogen_ext_yepcode._yepcode_executor.asyncio.sleep", new_callable=AsyncMock)
+    async def test_execute_code_blocks_polls_pending_execution(
+        self, mock_sleep, executor_with_token, mock_runner, thread_pool
+    ):
+        """Test pending executions are polled until they finish."""
+        executor_with_token._started = True
+        executor_with_token._pool = thread_pool
+
+        mock_execution = MagicMock()
+        mock_execution.id = "test-id"
+        mock_execution.error = None
+        mock_execution.return_value = "done"
+        mock_execution.logs = []
+        executor_with_token._runner = mock_runner(lambda code, options: mock_execution)
+        executor_with_token._runner.yepcode_api.get_execution.side_effect = [
+            {"status": "CREATED"},
+            {"status": "RUNNING"},
+            {"status": "FINISHED"},
+        ]
+
+        code_blocks = [CodeBlock(code="print('test')", language="python")]
+
+        result = await executor_with_token.execute_code_blocks(
+            code_blocks, CancellationToken()
+        )
+
+        assert result.exit_code == 0
+        assert result.output == "Execution result:\ndone"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.2, 0.4]
+        # The execution is only loaded once it has finished
+        executor_with_token._runner.get_execution.assert_called_once_with(
+            "execution-0"
+        )
 
     @pytest.mark.asyncio
-    @patch("autogen_ext_yepcode._yepcode_executor.asyncio.to_thread")
     async def test_execute_code_blocks_execution_error(
-        self, mock_to_thread, executor_with_token
+        self, executor_with_token, mock_runner, thread_pool
     ):
         """Test code block execution with execution error."""
         # Setup
         executor_with_token._started = True
-        executor_with_token._runner = MagicMock()
+        executor_with_token._pool = thread_pool
 
         # Mock execution result with error
         mock_execution = MagicMock()
         mock_execution.id = "test-id"
         mock_execution.error = "Division by zero"
 
-        mock_to_thread.side_effect = [mock_execution, None]
+        executor_with_token._runner = mock_runner(lambda code, options: mock_execution)
 
         code_blocks = [CodeBlock(code="print(1/0)", language="python")]
 
@@ -221,17 +438,17 @@ class TestYepCodeCodeExecutor:
         assert result.execution_id == "test-id"
 
     @pytest.mark.asyncio
-    @patch("autogen_ext_yepcode._yepcode_executor.asyncio.to_thread")
     async def test_execute_code_blocks_exception(
-        self, mock_to_thread, executor_with_token
+        self, executor_with_token, mock_runner, thread_pool
     ):
         """Test code block execution with exception."""
         # Setup
         executor_with_token._started = True
-        executor_with_token._runner = MagicMock()
+        executor_with_token._pool = thread_pool
 
         # Mock exception
-        mock_to_thread.side_effect = Exception("Network error")
+        executor_with_token._runner = mock_runner(MagicMock())
+        executor_with_token._runner.create_process.side_effect = Exception("Network error")
 
         code_blocks = [CodeBlock(code="print('test')", language="python")]
 
@@ -242,6 +459,456 @@ class TestYepCodeCodeExecutor:
         assert result.exit_code == 1
         assert "Error executing code: Network error" in result.output
 
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_remove_on_done(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test the process is removed once its execution has finished."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, remove_on_done=True)
+        executor._started = True
+        executor._pool = thread_pool
+        mock_execution = MagicMock(error=None, logs=[])
+        mock_execution.return_value = None
+        executor._runner = mock_runner(lambda code, options: mock_execution)
+
+        code_blocks = [CodeBlock(code="print('test')", language="python")]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        executor._runner.yepcode_api.delete_process.assert_called_once_with(
+            "print('test')"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_remove_on_done_duplicates(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test a process shared by concurrent executions is removed after the last one."""
+        executor = YepCodeCodeExecutor(
+            api_token=mock_api_token, remove_on_done=True, max_concurrency=2
+        )
+        executor._started = True
+        executor._pool = thread_pool
+        mock_execution = MagicMock(error=None, logs=[])
+        mock_execution.return_value = None
+        executor._runner = runner = mock_runner(lambda code, options: mock_execution)
+        loaded_on_delete = []
+        runner.yepcode_api.delete_process.side_effect = (
+            lambda process_id: loaded_on_delete.append(runner.get_execution.call_count)
+        )
+
+        code_blocks = [
+            CodeBlock(code="print('test')", language="python"),
+            CodeBlock(code="print('test')", language="python"),
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        assert loaded_on_delete == [2]
+        assert executor._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_async_execution(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test executions are not waited for when sync_execution is False."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, sync_execution=False)
+        executor._started = True
+        executor._pool = thread_pool
+        executor._runner = mock_runner(MagicMock())
+
+        code_blocks = [CodeBlock(code="print('test')", language="python")]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        assert result.output == "Execution started with ID: execution-0"
+        assert result.execution_id == "execution-0"
+        executor._runner.yepcode_api.get_execution.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_concurrently(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test concurrent code block execution preserves block order."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, max_concurrency=3)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            mock_execution = MagicMock()
+            mock_execution.id = f"id-{code}"
+            mock_execution.error = None
+            mock_execution.return_value = code
+            mock_execution.logs = []
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code=str(i), language="python") for i in range(5)
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        assert result.output == "\n===\n".join(
+            f"Execution result:\n{i}" for i in range(5)
+        )
+        assert result.execution_id == "id-4"
+        assert executor._runner.create_process.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_concurrently_first_error(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test concurrent execution reports the first failed block in order."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, max_concurrency=2)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            mock_execution = MagicMock()
+            mock_execution.id = f"id-{code}"
+            mock_execution.error = f"error-{code}" if code != "0" else None
+            mock_execution.return_value = code
+            mock_execution.logs = []
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code=str(i), language="python") for i in range(3)
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 1
+        assert "error-1" in result.output
+        assert result.execution_id == "id-1"
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_memoization(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test memoized results skip repeated executions of the same code."""
+        executor = YepCodeCodeExecutor(
+            api_token=mock_api_token, enable_memoization=True, memo_max_entries=1
+        )
+        executor._started = True
+        executor._pool = thread_pool
+
+        mock_execution = MagicMock()
+        mock_execution.id = "test-id"
+        mock_execution.error = None
+        mock_execution.return_value = "cached"
+        mock_execution.logs = []
+        executor._runner = mock_runner(lambda code, options: mock_execution)
+
+        first = [CodeBlock(code="print('a')", language="python")]
+        second = [CodeBlock(code="print('b')", language="py")]
+
+        result = await executor.execute_code_blocks(first, CancellationToken())
+        repeated = await executor.execute_code_blocks(first, CancellationToken())
+
+        assert repeated.output == result.output == "Execution result:\ncached"
+        assert repeated.execution_id == "test-id"
+        assert executor._runner.create_process.call_count == 1
+
+        # A different block evicts the only memoized entry
+        await executor.execute_code_blocks(second, CancellationToken())
+        await executor.execute_code_blocks(first, CancellationToken())
+
+        assert executor._runner.create_process.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_memoization_skips_errors(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test failed executions are not memoized."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, enable_memoization=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        mock_execution = MagicMock()
+        mock_execution.id = "test-id"
+        mock_execution.error = "Division by zero"
+        executor._runner = mock_runner(lambda code, options: mock_execution)
+
+        code_blocks = [CodeBlock(code="print(1/0)", language="python")]
+
+        await executor.execute_code_blocks(code_blocks, CancellationToken())
+        await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert executor._runner.create_process.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test consecutive blocks of the same language run in one execution."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            markers = [
+                line.split('"')[1]
+                for line in code.splitlines()
+                if line.startswith("print(\"--- block")
+            ]
+            mock_execution = MagicMock()
+            mock_execution.id = f"id-{options['language']}"
+            mock_execution.error = None
+            mock_execution.return_value = "last" if markers else None
+            mock_execution.logs = [
+                MagicMock(timestamp="t", level="INFO", message=message)
+                for message in [markers[0], "a", markers[1], "b"]
+            ] if markers else []
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code="print('a')", language="python"),
+            CodeBlock(code="print('b')", language="py"),
+            CodeBlock(code="console.log('c')", language="javascript"),
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        assert result.output == (
+            "\n\nExecution logs:\nt - INFO: a"
+            "\n===\n"
+            "Execution result:\nlast\n\nExecution logs:\nt - INFO: b"
+            "\n===\n"
+        )
+        assert result.execution_id == "id-javascript"
+        assert executor._runner.create_process.call_count == 2
+        fused_code = executor._runner.create_process.call_args_list[0].args[0]
+        assert "print('a')" in fused_code and "print('b')" in fused_code
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused_reuses_process(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test fusing the same blocks again submits the same code."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            mock_execution = MagicMock()
+            mock_execution.error = None
+            mock_execution.return_value = None
+            mock_execution.logs = [
+                MagicMock(timestamp="t", level="INFO", message=line.split('"')[1])
+                for line in code.splitlines()
+                if line.startswith("print(\"--- block")
+            ]
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code="print('a')", language="python"),
+            CodeBlock(code="print('b')", language="python"),
+        ]
+
+        await executor.execute_code_blocks(code_blocks, CancellationToken())
+        await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        first, second = executor._runner.create_process.call_args_list
+        assert first.args[0] == second.args[0]
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused_skips_javascript(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test JavaScript blocks are never fused."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+        executor._runner = mock_runner(lambda code, options: MagicMock(error=None))
+
+        code_blocks = [
+            CodeBlock(code="const a = 1;\nconsole.log(a)", language="js"),
+            CodeBlock(code="const a = 2;\nconsole.log(a)", language="javascript"),
+        ]
+
+        await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert [c.args[0] for c in executor._runner.create_process.call_args_list] == [
+            code_block.code for code_block in code_blocks
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused_skips_entry_points(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test blocks with the documented main() shape run on their own."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            mock_execution = MagicMock()
+            mock_execution.error = None
+            mock_execution.return_value = {"block": code.rsplit("'", 2)[1]}
+            mock_execution.logs = []
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(
+                code="def main():\n    return {'message': 'a'}", language="python"
+            ),
+            CodeBlock(
+                code="def main():\n    return {'message': 'b'}", language="python"
+            ),
+            CodeBlock(
+                code="from __future__ import annotations\nprint('c')",
+                language="python",
+            ),
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        assert result.output == "\n===\n".join(
+            [
+                "Execution result:\n{'block': 'a'}",
+                "Execution result:\n{'block': 'b'}",
+                "Execution result:\n{'block': 'c'}",
+            ]
+        )
+        assert [c.args[0] for c in executor._runner.create_process.call_args_list] == [
+            code_block.code for code_block in code_blocks
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused_syntax_error(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test a fused program failing before any block runs falls back to single blocks."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            mock_execution = MagicMock()
+            mock_execution.return_value = None
+            mock_execution.logs = []
+            # Nothing is logged, as the program fails before running
+            mock_execution.error = "SyntaxError" if "x = (" in code else None
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code="print('a')", language="python"),
+            CodeBlock(code="x = (", language="python"),
+            CodeBlock(code="print('c')", language="python"),
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 1
+        assert result.output == "Execution failed with error:\nSyntaxError"
+        assert [c.args[0] for c in executor._runner.create_process.call_args_list][1:] == [
+            "print('a')",
+            "x = (",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused_missing_markers(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test blocks whose markers were never printed are executed one by one."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            lines = code.splitlines()
+            # The program exits in the second block, so the third marker is missing
+            if "sys.exit()" in lines:
+                lines = lines[: lines.index("sys.exit()")]
+            mock_execution = MagicMock()
+            mock_execution.error = None
+            mock_execution.return_value = None
+            mock_execution.logs = [
+                MagicMock(timestamp="t", level="INFO", message=line.split('"')[1])
+                for line in lines
+                if line.startswith("print(\"--- block")
+            ]
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code="print('a')", language="python"),
+            CodeBlock(code="import sys\nsys.exit()", language="python"),
+            CodeBlock(code="print('c')", language="python"),
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 0
+        assert [c.args[0] for c in executor._runner.create_process.call_args_list][1:] == [
+            code_block.code for code_block in code_blocks
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_code_blocks_fused_error(
+        self, mock_api_token, mock_runner, thread_pool
+    ):
+        """Test a fused execution error is reported for the failing block."""
+        executor = YepCodeCodeExecutor(api_token=mock_api_token, fuse_blocks=True)
+        executor._started = True
+        executor._pool = thread_pool
+
+        def run(code, options):
+            markers = [
+                line.split('"')[1]
+                for line in code.splitlines()
+                if line.startswith("print(\"--- block")
+            ]
+            mock_execution = MagicMock()
+            mock_execution.id = "test-id"
+            mock_execution.error = "Division by zero"
+            mock_execution.logs = [
+                MagicMock(timestamp="t", level="INFO", message=message)
+                for message in [markers[0], "a", markers[1]]
+            ]
+            return mock_execution
+
+        executor._runner = mock_runner(run)
+
+        code_blocks = [
+            CodeBlock(code="print('a')", language="python"),
+            CodeBlock(code="print(1/0)", language="python"),
+            CodeBlock(code="print('c')", language="python"),
+        ]
+
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert result.exit_code == 1
+        assert result.output == "Execution failed with error:\nDivision by zero"
+        assert result.execution_id == "test-id"
+        executor._runner.create_process.assert_called_once()
+
+    def test_init_with_invalid_max_concurrency(self, mock_api_token):
+        """Test executor initialization with invalid max concurrency raises error."""
+        with pytest.raises(
+            ValueError, match="Max concurrency must be greater than or equal to 1"
+        ):
+            YepCodeCodeExecutor(api_token=mock_api_token, max_concurrency=0)
+
     @pytest.mark.asyncio
     async def test_context_manager(self, executor_with_token):
         """Test executor as async context manager."""
@@ -261,6 +928,20 @@ class TestYepCodeCodeExecutor:
         assert config.timeout == executor_with_token._timeout
         assert config.remove_on_done == executor_with_token._remove_on_done
         assert config.sync_execution == executor_with_token._sync_execution
+        assert config.max_concurrency == executor_with_token._max_concurrency
+        assert config.max_workers == executor_with_token._max_workers
+        assert config.enable_memoization == executor_with_token._enable_memoization
+        assert config.memo_max_entries == executor_with_token._memo_max_entries
+        assert config.fuse_blocks == executor_with_token._fuse_blocks
+        assert config.warmup == executor_with_token._warmup
+
+    def test_dump_and_load_component(self, executor_with_token):
+        """Test round-tripping the executor through its component model."""
+        component = executor_with_token.dump_component()
+        executor = YepCodeCodeExecutor.load_component(component)
+
+        assert component.config["api_token"] == executor_with_token._api_token
+        assert executor._to_config() == executor_with_token._to_config()
 
     def test_from_config(self, mock_api_token):
         """Test creating executor from config."""
@@ -271,6 +952,12 @@ class TestYepCodeCodeExecutor:
             timeout=120,
             remove_on_done=False,
             sync_execution=False,
+            max_concurrency=4,
+            max_workers=8,
+            enable_memoization=True,
+            memo_max_entries=16,
+            fuse_blocks=True,
+            warmup=True,
         )
 
         executor = YepCodeCodeExecutor._from_config(config)
@@ -279,6 +966,12 @@ class TestYepCodeCodeExecutor:
         assert executor._timeout == 120
         assert executor._remove_on_done is False
         assert executor._sync_execution is False
+        assert executor._max_concurrency == 4
+        assert executor._max_workers == 8
+        assert executor._enable_memoization is True
+        assert executor._memo_max_entries == 16
+        assert executor._fuse_blocks is True
+        assert executor._warmup is True
 
 
 class TestYepCodeCodeResult: